@@ -0,0 +1,34 @@
+"""
+Copyright (c) 2026 Steve Mathews Korah. All rights reserved.
+
+DISCLAIMER: This project, "Race-Monte-Carlo-Simulation", is proprietary software.
+Any external use, reproduction, or distribution of this code in any capacity
+without explicit written permission from Steve Mathews Korah is strictly prohibited.
+
+This project utilizes the "Fast-F1" library (theOehrly/Fast-F1).
+We do not claim ownership of the Fast-F1 library or the underlying F1 data
+provided by its API. Use of Fast-F1 data is subject to their own terms and disclaimers.
+
+Ahead-of-time compiles the Numba race kernel into the `race_sim_aot`
+extension module, so fresh processes skip JIT warmup:
+
+    python aot_build.py
+"""
+from numba.pycc import CC
+from race_simulator import _simulate_race_core, _seed_numba_rng
+
+cc = CC('race_sim_aot')
+
+# Same argument and return types as _simulate_race_core
+cc.export(
+    'simulate_race_core',
+    'Tuple((f8[:], f8[:], f8[:], f8[:], f8[:], f8[:], f8[:], b1[:], b1, i8))'
+    '(f8, f8, i8, i8, f8, f8[:], f8, f8[:], i8, b1, f8[:, :, :], b1)'
+)(_simulate_race_core.py_func)
+
+# The AOT module has its own generator state, so it needs its own seeder
+cc.export('seed', 'void(i8)')(_seed_numba_rng.py_func)
+
+
+if __name__ == '__main__':
+    cc.compile()
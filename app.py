@@ -12,8 +12,10 @@ provided by its API. Use of Fast-F1 data is subject to their own terms and discl
 import streamlit as st
 import numpy as np
 import pandas as pd
-from race_simulator import simulate_race, run_monte_carlo, StrategyOptimizer
-from visuals import show_telemetry, plot_comparison, plot_strategy_optimization
+import plotly.graph_objects as go
+from race_simulator import simulate_race, run_monte_carlo, run_mc_parallel, run_mc_pool, core_args, StrategyOptimizer
+from numba_compat import NUMBA_AVAILABLE
+from visuals import show_telemetry, show_comparison, show_strategy_optimization
 from fastf1_helper import get_session_data, get_driver_laps, get_race_summary, get_session_drivers, get_track_constants
 
 st.set_page_config(
@@ -42,21 +44,21 @@ with st.sidebar.expander("Import Real F1 Session"):
         with st.spinner("Fetching drivers..."):
             session = get_session_data(ff1_year, ff1_gp)
             if session:
-                st.session_state.ff1_session = session
-                st.session_state.ff1_drivers = get_session_drivers(session)
+                st.session_state.ff1_event = (ff1_year, ff1_gp)
+                st.session_state.ff1_drivers = get_session_drivers(ff1_year, ff1_gp)
             else:
                 st.error("Failed to load session.")
 
     if 'ff1_drivers' in st.session_state:
         driver = st.selectbox("Select Driver", st.session_state.ff1_drivers)
         if st.button("Apply as Base"):
-            summary = get_race_summary(st.session_state.ff1_session, driver)
+            summary = get_race_summary(*st.session_state.ff1_event, driver)
             if summary:
-                st.session_state.ff1_real_data = get_driver_laps(st.session_state.ff1_session, driver)
+                st.session_state.ff1_real_data = get_driver_laps(*st.session_state.ff1_event, driver)
                 st.session_state.ff1_summary = summary
                 
                 # Track calibration
-                venue = st.session_state.ff1_session.event['EventName']
+                venue = summary['event']
                 track_data = get_track_constants(venue)
                 st.session_state.track_data = track_data
                 
@@ -94,7 +96,7 @@ pit_loss = st.sidebar.slider("Pit Loss Time (s)", 15.0, 30.0, default_pit_loss)
 deg_factor = 1.0
 if 'track_data' in st.session_state:
     deg_factor = st.session_state.track_data['deg_factor']
-    st.sidebar.info(f"📍 Track Calibration: {st.session_state.ff1_session.event['EventName']} (Deg: {deg_factor}x)")
+    st.sidebar.info(f"📍 Track Calibration: {st.session_state.ff1_summary['event']} (Deg: {deg_factor}x)")
 
 st.sidebar.header("🎲 Simulation")
 enable_sc = st.sidebar.checkbox("Enable Safety Car", value=True)
@@ -127,19 +129,34 @@ sim_params = {
 # =============================================================================
 if st.button("🎲 Run Monte Carlo Analysis", type="primary"):
     progress_bar = st.progress(0, text="Initializing simulations...")
-    results = []
+    chunk = max(1, sims // 10)
     
-    for i in range(sims):
-        t, df, dnf, dnf_lap = simulate_race(**sim_params)
-        if not dnf:
-            results.append(t)
+    if NUMBA_AVAILABLE or sims < 1000:
+        params = core_args(sim_params)
+        finished_times = []
         
-        if (i + 1) % (sims // 10) == 0:
-            progress_bar.progress((i + 1) / sims, text=f"Simulating race {i + 1}/{sims}...")
+        for start in range(0, sims, chunk):
+            n = min(chunk, sims - start)
+            times, dnf = run_mc_parallel(params, n)
+            finished_times.append(times[~dnf])
+            progress_bar.progress((start + n) / sims, text=f"Simulating race {start + n}/{sims}...")
+        
+        results = np.concatenate(finished_times)
+    else:
+        # No JIT threads without Numba; fan out across processes instead
+        finished_times = []
+        
+        for i, (t, dnf) in enumerate(run_mc_pool(sim_params, sims)):
+            if not dnf:
+                finished_times.append(t)
+            if (i + 1) % chunk == 0:
+                progress_bar.progress((i + 1) / sims, text=f"Simulating race {i + 1}/{sims}...")
+        
+        results = np.array(finished_times)
     
     progress_bar.empty()
     
-    if results:
+    if len(results):
         st.success(f"✅ Completed {sims} simulations | {len(results)} finished races")
         
         col1, col2, col3, col4 = st.columns(4)
@@ -176,8 +193,7 @@ if st.button("Simulate Individual Race"):
     # Comparison plot if real data is available
     if 'ff1_real_data' in st.session_state:
         st.subheader("🏁 Real vs Simulated Comparison")
-        comp_plot = plot_comparison(race_df, st.session_state.ff1_real_data, st.session_state.ff1_summary['driver'])
-        st.plotly_chart(comp_plot, use_container_width=True)
+        show_comparison(race_df, st.session_state.ff1_real_data, st.session_state.ff1_summary['driver'])
 
     show_telemetry(race_df)
     
@@ -206,8 +222,9 @@ if st.button("Find Optimal Strategy"):
             c2.metric("Optimal Pit Lap", f"Lap {best['pit_lap']}")
             c3.metric("Expected Race Time", f"{best['expected_time']:.2f}s")
             
-            st.markdown(f"> **Engineer's Note**: For {st.session_state.ff1_session.event['EventName'] if 'ff1_session' in st.session_state else 'this track'}, the best chance of victory is pushing a **{best['compound']}** stint until **Lap {best['pit_lap']}**.")
+            st.markdown(f"> **Engineer's Note**: For {st.session_state.ff1_summary['event'] if 'ff1_summary' in st.session_state else 'this track'}, the best chance of victory is pushing a **{best['compound']}** stint until **Lap {best['pit_lap']}**.")
             
-            st.plotly_chart(plot_strategy_optimization(full_df), use_container_width=True)
+            # Golden-search samples are sparse and differ per compound, so draw lines
+            show_strategy_optimization(full_df, mode='lines')
         else:
             st.error("Optimization failed. All tested strategies resulted in DNF.")
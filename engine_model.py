@@ -10,15 +10,23 @@ We do not claim ownership of the Fast-F1 library or the underlying F1 data
 provided by its API. Use of Fast-F1 data is subject to their own terms and disclaimers.
 """
 import numpy as np
+from numba_compat import njit, vectorize
 
 # =============================================================================
 # ENGINE MODEL
 # =============================================================================
 
+@vectorize([
+    'float32(float32, float32, float32)',
+    'float64(float64, float64, float64)'
+], cache=True)
 def engine_power(throttle: float, rpm: float, degradation: float) -> float:
     """
     Calculates engine output power (hp).
     
+    Compiled as a NumPy ufunc, so it accepts scalars or arrays; float32
+    arrays stay float32.
+    
     Args:
         throttle: Throttle position (0-100%)
         rpm: Engine revolutions per minute
@@ -31,19 +39,19 @@ def engine_power(throttle: float, rpm: float, degradation: float) -> float:
     return base_power * (throttle / 100) * (rpm / 15000) * (1 - degradation)
 
 
-def update_engine_deg(current_deg: float, stress: float, lap: int, total_laps: int) -> float:
+@njit(cache=True)
+def engine_wear(stress: float, lap: int, total_laps: int) -> float:
     """
-    Exponential engine degradation model.
-    Degradation accelerates in the final third of the race.
+    Deterministic part of the per-lap engine degradation.
+    Wear accelerates as the race progresses.
     
     Args:
-        current_deg: Current degradation level (0-1)
         stress: Engine stress multiplier (0.5-2.0)
         lap: Current lap number
         total_laps: Total laps in race
     
     Returns:
-        Updated degradation value (capped at 1.0)
+        Degradation added this lap, before random noise
     """
     base_rate = 0.0001
     stress_factor = 1 + (stress - 1) * 0.5
@@ -52,12 +60,44 @@ def update_engine_deg(current_deg: float, stress: float, lap: int, total_laps: i
     race_progress = lap / total_laps
     progression_factor = 1 + race_progress * 0.5
     
-    wear = base_rate * stress_factor * progression_factor
-    noise = np.random.normal(0, 0.0002)
+    return base_rate * stress_factor * progression_factor
+
+
+@njit(cache=True)
+def build_engine_wear_table(stress: float, total_laps: int) -> np.ndarray:
+    """
+    Precomputes engine_wear for every lap of the race.
     
-    return min(1.0, max(0, current_deg + wear + noise))
+    Returns:
+        Array of length `total_laps` where
+        table[lap - 1] = engine_wear(stress, lap, total_laps)
+    """
+    table = np.empty(total_laps)
+    for lap in range(1, total_laps + 1):
+        table[lap - 1] = engine_wear(stress, lap, total_laps)
+    return table
 
 
+@njit(cache=True)
+def update_engine_deg(current_deg: float, stress: float, lap: int, total_laps: int) -> float:
+    """
+    Exponential engine degradation model.
+    Degradation accelerates in the final third of the race.
+    
+    Args:
+        current_deg: Current degradation level (0-1)
+        stress: Engine stress multiplier (0.5-2.0)
+        lap: Current lap number
+        total_laps: Total laps in race
+    
+    Returns:
+        Updated degradation value (capped at 1.0)
+    """
+    noise = np.random.normal(0, 0.0002)
+    return min(1.0, max(0.0, current_deg + engine_wear(stress, lap, total_laps) + noise))
+
+
+@njit(cache=True)
 def simulate_engine_telemetry(engine_deg: float) -> tuple[float, float, float]:
     """
     Simulates real-time engine telemetry data.
@@ -75,6 +115,7 @@ def simulate_engine_telemetry(engine_deg: float) -> tuple[float, float, float]:
 # FUEL MODEL
 # =============================================================================
 
+@njit(cache=True)
 def fuel_effect(lap: int, fuel_load_kg: float = 110.0, burn_rate: float = 2.1) -> float:
     """
     Calculates lap time penalty from fuel weight.
@@ -92,11 +133,25 @@ def fuel_effect(lap: int, fuel_load_kg: float = 110.0, burn_rate: float = 2.1) -
     Returns:
         Lap time penalty in seconds
     """
-    fuel_remaining = max(0, fuel_load_kg - (lap * burn_rate))
+    fuel_remaining = max(0.0, fuel_load_kg - (lap * burn_rate))
     time_penalty = fuel_remaining * 0.03  # 0.03s per kg
     return time_penalty
 
 
+@njit(cache=True)
+def build_fuel_table(laps: int, fuel_load_kg: float = 110.0, burn_rate: float = 2.1) -> np.ndarray:
+    """
+    Precomputes fuel_effect for every lap of the race.
+    
+    Returns:
+        Array of length `laps` where table[lap - 1] = fuel_effect(lap, ...)
+    """
+    table = np.empty(laps)
+    for lap in range(1, laps + 1):
+        table[lap - 1] = fuel_effect(lap, fuel_load_kg, burn_rate)
+    return table
+
+
 # =============================================================================
 # TYRE MODEL
 # =============================================================================
@@ -107,8 +162,33 @@ TYRE_COMPOUNDS = {
     'hard':   {'grip_bonus': +0.5, 'base_deg': 0.010, 'cliff_lap': 35},
 }
 
+# Array view of TYRE_COMPOUNDS for compiled code, indexed by compound id
+COMPOUND_IDS = {name: i for i, name in enumerate(TYRE_COMPOUNDS)}
+_GRIP_BONUS = np.array([c['grip_bonus'] for c in TYRE_COMPOUNDS.values()], dtype=np.float64)
+_BASE_DEG = np.array([c['base_deg'] for c in TYRE_COMPOUNDS.values()], dtype=np.float64)
+_CLIFF_LAP = np.array([c['cliff_lap'] for c in TYRE_COMPOUNDS.values()], dtype=np.int64)
 
-def tyre_degradation(stint_lap: int, compound: str = 'medium', deg_factor: float = 1.0) -> tuple[float, float]:
+# 1.2 ** k lookup for the post-cliff penalty; over_cliff is clamped to the last entry
+_POW12 = np.array([1.2 ** k for k in range(256)], dtype=np.float64)
+
+
+def tyre_compound_id(compound: str) -> int:
+    """
+    Maps a compound name to its integer id, defaulting to medium.
+    """
+    return COMPOUND_IDS.get(compound, COMPOUND_IDS['medium'])
+
+
+@njit(cache=True)
+def _tyre_params(compound_id: int) -> tuple[float, float, int]:
+    """
+    Returns (grip_bonus, base_deg, cliff_lap) for a compound id.
+    """
+    return _GRIP_BONUS[compound_id], _BASE_DEG[compound_id], _CLIFF_LAP[compound_id]
+
+
+@njit(cache=True)
+def tyre_degradation(stint_lap: int, compound_id: int = 1, deg_factor: float = 1.0) -> tuple[float, float]:
     """
     Non-linear tyre degradation with cliff effect.
     
@@ -116,16 +196,14 @@ def tyre_degradation(stint_lap: int, compound: str = 'medium', deg_factor: float
     
     Args:
         stint_lap: Laps since last pit stop
-        compound: 'soft', 'medium', or 'hard'
+        compound_id: Compound id from tyre_compound_id (0=soft, 1=medium, 2=hard)
         deg_factor: Track abrasiveness multiplier
     
     Returns:
         Tuple of (degradation_penalty, grip_bonus)
     """
-    compound_data = TYRE_COMPOUNDS.get(compound, TYRE_COMPOUNDS['medium'])
-    cliff_lap = compound_data['cliff_lap']
-    base_deg = compound_data['base_deg'] * deg_factor
-    grip_bonus = compound_data['grip_bonus']
+    grip_bonus, base_deg, cliff_lap = _tyre_params(compound_id)
+    base_deg = base_deg * deg_factor
     
     if stint_lap <= cliff_lap:
         # Linear degradation before cliff
@@ -135,16 +213,39 @@ def tyre_degradation(stint_lap: int, compound: str = 'medium', deg_factor: float
         over_cliff = stint_lap - cliff_lap
         pre_cliff_deg = base_deg * cliff_lap
         # Penalty also scaled by deg_factor
-        cliff_penalty = 0.15 * deg_factor * (1.2 ** over_cliff - 1)
+        cliff_penalty = 0.15 * deg_factor * (_POW12[min(over_cliff, 255)] - 1)
         degradation = pre_cliff_deg + cliff_penalty
     
     return degradation, grip_bonus
 
 
+@njit(cache=True)
+def build_tyre_table(deg_factor: float, max_laps: int) -> np.ndarray:
+    """
+    Precomputes tyre_degradation for every compound and stint length.
+    
+    Args:
+        deg_factor: Track abrasiveness multiplier
+        max_laps: Longest stint to tabulate
+    
+    Returns:
+        Array of shape (3, max_laps + 1, 2) where
+        table[compound_id, stint_lap] = (degradation_penalty, grip_bonus)
+    """
+    table = np.empty((_GRIP_BONUS.shape[0], max_laps + 1, 2))
+    for compound_id in range(table.shape[0]):
+        for stint_lap in range(max_laps + 1):
+            degradation, grip_bonus = tyre_degradation(stint_lap, compound_id, deg_factor)
+            table[compound_id, stint_lap, 0] = degradation
+            table[compound_id, stint_lap, 1] = grip_bonus
+    return table
+
+
 # =============================================================================
 # SAFETY CAR MODEL
 # =============================================================================
 
+@njit(cache=True)
 def safety_car_check(lap: int, total_laps: int) -> bool:
     """
     Stochastic safety car event simulation.
@@ -160,6 +261,21 @@ def safety_car_check(lap: int, total_laps: int) -> bool:
     Returns:
         True if Safety Car is deployed this lap
     """
+    return np.random.random() < safety_car_probability(lap, total_laps)
+
+
+@njit(cache=True)
+def safety_car_probability(lap: int, total_laps: int) -> float:
+    """
+    Per-lap probability of a Safety Car deployment.
+    
+    Args:
+        lap: Current lap number
+        total_laps: Total laps in race
+    
+    Returns:
+        Deployment probability for this lap
+    """
     base_prob = 0.012  # ~1.2% per lap gives ~60% over 50 laps
     
     # Higher incident rate at race start and end
@@ -168,9 +284,25 @@ def safety_car_check(lap: int, total_laps: int) -> bool:
     elif lap >= total_laps - 5:
         base_prob = 0.020  # Late race desperation
     
-    return np.random.random() < base_prob
+    return base_prob
+
+
+@njit(cache=True)
+def build_safety_car_table(total_laps: int) -> np.ndarray:
+    """
+    Precomputes safety_car_probability for every lap of the race.
+    
+    Returns:
+        Array of length `total_laps` where
+        table[lap - 1] = safety_car_probability(lap, total_laps)
+    """
+    table = np.empty(total_laps)
+    for lap in range(1, total_laps + 1):
+        table[lap - 1] = safety_car_probability(lap, total_laps)
+    return table
 
 
+@njit(cache=True)
 def safety_car_laps() -> int:
     """
     Returns the duration of a Safety Car period.
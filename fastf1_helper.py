@@ -1,62 +1,92 @@
 import fastf1
+import streamlit as st
 import pandas as pd
 import numpy as np
-import os
+from pathlib import Path
 
-# Create a cache directory for FastF1
+# Cache directory for FastF1, created on first session load
 CACHE_DIR = 'fastf1_cache'
-if not os.path.exists(CACHE_DIR):
-    os.makedirs(CACHE_DIR)
+_cache_enabled = False
 
-fastf1.Cache.enable_cache(CACHE_DIR)
+def _ensure_cache():
+    """
+    Creates and enables the FastF1 cache the first time it is needed,
+    keeping filesystem work out of import time.
+    """
+    global _cache_enabled
+    if not _cache_enabled:
+        Path(CACHE_DIR).mkdir(exist_ok=True)
+        fastf1.Cache.enable_cache(CACHE_DIR)
+        _cache_enabled = True
+
+@st.cache_resource(show_spinner=False)
+def _load_session(year, gp, session_type):
+    """
+    Loads a FastF1 session once per (year, gp, session_type).
+    Callers always pass session_type positionally so they share one
+    cache entry.
+    Raises on failure, so failed loads are not cached.
+    """
+    _ensure_cache()
+    session = fastf1.get_session(year, gp, session_type)
+    session.load()
+    return session
 
 def get_session_data(year, gp, session_type='R'):
     """
     Fetches session data from FastF1.
     """
     try:
-        session = fastf1.get_session(year, gp, session_type)
-        session.load()
-        return session
+        return _load_session(year, gp, session_type)
     except Exception as e:
         print(f"Error loading session: {e}")
         return None
 
-def get_driver_laps(session, driver_code):
+@st.cache_data(show_spinner=False)
+def get_driver_laps(year, gp, driver_code):
     """
     Extracts lap data for a specific driver.
+    Returns a plain DataFrame of the needed columns, so the cached copy
+    does not carry (and pickle) the whole FastF1 session.
     """
+    session = _load_session(year, gp, 'R')
     laps = session.laps.pick_driver(driver_code)
     # Filter out invalidated laps or non-timed laps if necessary
     # For simulation base, we want representative lap times
     laps = laps.dropna(subset=['LapTime'])
+    laps = pd.DataFrame(laps[['LapNumber', 'LapTime', 'PitInTime', 'PitOutTime']]).copy()
     
     # Convert LapTime to seconds
     laps['LapTimeSeconds'] = laps['LapTime'].dt.total_seconds()
     
     return laps
 
-def get_race_summary(session, driver_code):
+@st.cache_data(show_spinner=False)
+def get_race_summary(year, gp, driver_code):
     """
     Returns a summary of the race for the driver to calibrate the simulation.
     """
-    laps = get_driver_laps(session, driver_code)
+    laps = get_driver_laps(year, gp, driver_code)
     if laps.empty:
         return None
     
+    lap_times = laps['LapTimeSeconds'].to_numpy()
+    lap_numbers = laps['LapNumber'].to_numpy()
+    no_pit_in = laps['PitInTime'].isna().to_numpy()
+    no_pit_out = laps['PitOutTime'].isna().to_numpy()
+    
     # Calculate base lap (median of representative laps)
     # We exclude the first lap and pit laps for a better 'base' estimate
-    representative_laps = laps[laps['PitInTime'].isna() & laps['PitOutTime'].isna()]
-    if representative_laps.empty:
-        representative_laps = laps # fallback
+    representative = lap_times[no_pit_in & no_pit_out]
+    if representative.size == 0:
+        representative = lap_times # fallback
         
-    base_lap = representative_laps['LapTimeSeconds'].median()
-    lap_std = representative_laps['LapTimeSeconds'].std()
-    total_laps = int(laps['LapNumber'].max())
+    base_lap = np.median(representative)
+    lap_std = np.std(representative, ddof=1) if representative.size > 1 else np.nan
+    total_laps = int(lap_numbers.max())
     
     # Pit info
-    pit_stops = laps[laps['PitInTime'].notna()]
-    pit_laps = pit_stops['LapNumber'].tolist()
+    pit_laps = lap_numbers[~no_pit_in].tolist()
     
     return {
         'base_lap': float(base_lap),
@@ -64,15 +94,17 @@ def get_race_summary(session, driver_code):
         'total_laps': total_laps,
         'pit_laps': pit_laps,
         'driver': driver_code,
-        'event': session.event['EventName']
+        'event': _load_session(year, gp, 'R').event['EventName']
     }
 
-def get_session_drivers(session):
+@st.cache_data(show_spinner=False)
+def get_session_drivers(year, gp):
     """
     Returns a list of driver codes in the session.
     """
-    return session.results['Abbreviation'].tolist()
+    return _load_session(year, gp, 'R').results['Abbreviation'].tolist()
 
+@st.cache_data(show_spinner=False)
 def get_track_constants(venue_name):
     """
     Returns historical defaults for specific tracks.
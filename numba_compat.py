@@ -0,0 +1,31 @@
+"""
+Copyright (c) 2026 Steve Mathews Korah. All rights reserved.
+
+DISCLAIMER: This project, "Race-Monte-Carlo-Simulation", is proprietary software.
+Any external use, reproduction, or distribution of this code in any capacity
+without explicit written permission from Steve Mathews Korah is strictly prohibited.
+
+This project utilizes the "Fast-F1" library (theOehrly/Fast-F1).
+We do not claim ownership of the Fast-F1 library or the underlying F1 data
+provided by its API. Use of Fast-F1 data is subject to their own terms and disclaimers.
+
+Numba is optional. Without it the decorated kernels run as plain Python
+(vectorize falls back to numpy.vectorize), so everything still works,
+only slower.
+"""
+try:
+    from numba import njit, prange, vectorize
+    NUMBA_AVAILABLE = True
+except ImportError:
+    import numpy as np
+
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+    def vectorize(*args, **kwargs):
+        return lambda func: np.vectorize(func, otypes=[np.float64])
@@ -9,68 +9,150 @@ This project utilizes the "Fast-F1" library (theOehrly/Fast-F1).
 We do not claim ownership of the Fast-F1 library or the underlying F1 data 
 provided by its API. Use of Fast-F1 data is subject to their own terms and disclaimers.
 """
+import inspect
+import itertools
+import multiprocessing
+import os
 import numpy as np
 import pandas as pd
+from scipy.optimize import minimize_scalar
+from numba_compat import njit, prange, vectorize
 from engine_model import (
     engine_power, 
-    update_engine_deg, 
+    build_engine_wear_table,
     simulate_engine_telemetry,
-    fuel_effect,
-    tyre_degradation,
+    build_fuel_table,
+    build_tyre_table,
     safety_car_check,
-    safety_car_laps
+    safety_car_laps,
+    build_safety_car_table,
+    tyre_compound_id
 )
 
+try:
+    # Optional AOT build (python setup.py build_ext --inplace); avoids JIT warmup
+    from race_simulator_c import simulate_race_c, seed_race_c
+except ImportError:
+    simulate_race_c = seed_race_c = None
 
-def simulate_race(
-    base_lap: float = 90.0,
-    lap_std: float = 0.5,
-    laps: int = 50,
-    pit_lap: int = 25,
-    pit_loss: float = 22.0,
-    engine_stress: float = 1.0,
-    reliability: float = 0.98,
-    fuel_load: float = 110.0,
-    tyre_compound: str = 'medium',
-    enable_safety_car: bool = True,
-    deg_factor: float = 1.0
-) -> tuple[float, pd.DataFrame, bool, int | None]:
+try:
+    # Optional Numba AOT build of _simulate_race_core (python aot_build.py)
+    from race_sim_aot import simulate_race_core as _simulate_race_core_aot
+    from race_sim_aot import seed as _seed_aot_rng
+except ImportError:
+    _simulate_race_core_aot = _seed_aot_rng = None
+
+# Shared generator for the vectorized driver when no seed is given
+_rng = np.random.default_rng()
+
+
+@njit(cache=True)
+def _seed_numba_rng(seed: int) -> None:
+    # Numba keeps its own generator state, separate from NumPy's
+    np.random.seed(seed)
+
+
+def seed_simulator(seed: int | None = None) -> None:
     """
-    Simulates a single race with realistic physics.
+    Reseeds every random stream the simulator draws from.
     
-    Features:
-    - Fuel load effect (heavier car = slower laps)
-    - Non-linear tyre degradation with cliff
-    - Safety Car probability
-    - Engine reliability and degradation
+    Covers the shared generator used by run_monte_carlo and the compiled
+    race kernels (Numba JIT, AOT and Cython builds). Threads spawned by
+    run_mc_parallel keep their own Numba states and are not reseeded.
     
     Args:
-        base_lap: Baseline lap time on empty track, fresh tyres, no fuel
-        lap_std: Standard deviation for lap time variability
-        laps: Total race laps
-        pit_lap: Planned pit stop lap
-        pit_loss: Time lost during pit stop (seconds)
-        engine_stress: Engine stress multiplier (0.5=conservative, 2.0=push)
-        reliability: Base engine reliability (0.90-1.0)
-        fuel_load: Starting fuel in kg
-        tyre_compound: 'soft', 'medium', or 'hard'
-        enable_safety_car: Whether to simulate SC events
-        deg_factor: Track abrasiveness multiplier
+        seed: RNG seed, or None for fresh OS entropy
+    """
+    global _rng
+    _rng = np.random.default_rng(seed)
+    if seed is not None:
+        _seed_numba_rng(seed)
+        if _seed_aot_rng is not None:
+            _seed_aot_rng(seed)
+    if seed_race_c is not None:
+        seed_race_c(seed)
+
+
+@vectorize([
+    'float32(boolean, float32, float32, float32, float32, float32, float32)',
+    'float64(boolean, float64, float64, float64, float64, float64, float64)'
+], cache=True)
+def _assemble_lap_time(
+    sc_active: bool,
+    base_lap: float,
+    fuel_penalty: float,
+    tyre_deg_penalty: float,
+    grip_bonus: float,
+    power: float,
+    noise: float
+) -> float:
+    """
+    Combines the per-lap model terms into a lap time.
+    
+    A ufunc shared by the scalar core and the vectorized MC driver; the
+    latter gets the whole sum fused into one elementwise pass.
+    """
+    if sc_active:
+        # Safety Car pace is fixed ~30s slower
+        return base_lap + 30.0
+    return (
+        base_lap
+        + fuel_penalty                      # Fuel weight
+        + tyre_deg_penalty                  # Tyre wear
+        + grip_bonus                        # Compound grip difference
+        - (power - 900) * 0.002             # Engine power
+        + noise                             # Random variance
+    )
+
+
+@njit(cache=True)
+def _simulate_race_core(
+    base_lap: float,
+    lap_std: float,
+    laps: int,
+    pit_lap: int,
+    pit_loss: float,
+    wear_table: np.ndarray,
+    reliability: float,
+    fuel_table: np.ndarray,
+    compound_id: int,
+    enable_safety_car: bool,
+    tyre_table: np.ndarray,
+    record: bool
+):
+    """
+    Compiled lap loop behind simulate_race.
+    
+    Per-lap channels are written into preallocated arrays of length `laps`;
+    only the first `dnf_lap - 1` entries are valid when the car retires.
+    With `record` False only lap_times and sc_flags are filled and the other
+    telemetry arrays are returned empty. `wear_table`, `fuel_table` and
+    `tyre_table` come from build_engine_wear_table, build_fuel_table and
+    build_tyre_table for the same race length.
     
     Returns:
-        Tuple of (total_time, telemetry_df, dnf_flag, dnf_lap)
+        Tuple of (lap_times, powers, rpms, temps, engine_deg_arr, fuel_pen,
+        tyre_pen, sc_flags, dnf_flag, dnf_lap); dnf_lap is 0 for finishers.
     """
+    n_tel = laps if record else 0
+    lap_times = np.empty(laps)
+    powers = np.empty(n_tel)
+    rpms = np.empty(n_tel)
+    temps = np.empty(n_tel)
+    engine_deg_arr = np.empty(n_tel)
+    fuel_pen = np.empty(n_tel)
+    tyre_pen = np.empty(n_tel)
+    sc_flags = np.zeros(laps, dtype=np.bool_)
+    engine_noise = np.random.normal(0.0, 0.0002, laps)
+    
     engine_deg = 0.0
     stint_lap = 0
-    total_time = 0.0
-    telemetry = []
     dnf = False
-    dnf_lap = None
+    dnf_lap = 0
     
     # Safety Car state
     sc_active = False
     sc_laps_remaining = 0
-    current_compound = tyre_compound
 
     for lap in range(1, laps + 1):
         stint_lap += 1
@@ -91,24 +173,17 @@ def simulate_race(
         power = engine_power(throttle, rpm, engine_deg)
         
         # --- Fuel Effect ---
-        fuel_penalty = fuel_effect(lap, fuel_load)
+        fuel_penalty = fuel_table[lap - 1]
         
         # --- Tyre Degradation ---
-        tyre_deg_penalty, grip_bonus = tyre_degradation(stint_lap, current_compound, deg_factor)
+        tyre_deg_penalty = tyre_table[compound_id, stint_lap, 0]
+        grip_bonus = tyre_table[compound_id, stint_lap, 1]
         
         # --- Lap Time Calculation ---
-        if sc_active:
-            # Safety Car pace is fixed ~30s slower
-            lap_time = base_lap + 30.0
-        else:
-            lap_time = (
-                base_lap
-                + fuel_penalty                      # Fuel weight
-                + tyre_deg_penalty                  # Tyre wear
-                + grip_bonus                        # Compound grip difference
-                - (power - 900) * 0.002             # Engine power
-                + np.random.normal(0, lap_std)      # Random variance
-            )
+        noise = 0.0 if sc_active else np.random.normal(0, lap_std)
+        lap_time = _assemble_lap_time(
+            sc_active, base_lap, fuel_penalty, tyre_deg_penalty, grip_bonus, power, noise
+        )
         
         # --- DNF Check (Engine Failure) ---
         failure_prob = (1 - reliability) * (1 + engine_deg * 10)
@@ -123,24 +198,183 @@ def simulate_race(
             stint_lap = 0  # Reset tyre age
         
         # --- Update Engine ---
-        engine_deg = update_engine_deg(engine_deg, engine_stress, lap, laps)
-        total_time += lap_time
+        engine_deg = min(1.0, max(0.0, engine_deg + wear_table[lap - 1] + engine_noise[lap - 1]))
         
         # --- Log Telemetry ---
-        telemetry.append({
-            'Lap': lap,
-            'LapTime': lap_time,
-            'Power': power,
-            'RPM': rpm,
-            'Temp': temp,
-            'EngineDeg': engine_deg,
-            'FuelPenalty': fuel_penalty,
-            'TyreDeg': tyre_deg_penalty,
-            'SafetyCar': sc_active
-        })
-
-    df = pd.DataFrame(telemetry)
-    return total_time, df, dnf, dnf_lap
+        i = lap - 1
+        lap_times[i] = lap_time
+        sc_flags[i] = sc_active
+        if record:
+            powers[i] = power
+            rpms[i] = rpm
+            temps[i] = temp
+            engine_deg_arr[i] = engine_deg
+            fuel_pen[i] = fuel_penalty
+            tyre_pen[i] = tyre_deg_penalty
+
+    return (lap_times, powers, rpms, temps, engine_deg_arr,
+            fuel_pen, tyre_pen, sc_flags, dnf, dnf_lap)
+
+
+def simulate_race(
+    base_lap: float = 90.0,
+    lap_std: float = 0.5,
+    laps: int = 50,
+    pit_lap: int = 25,
+    pit_loss: float = 22.0,
+    engine_stress: float = 1.0,
+    reliability: float = 0.98,
+    fuel_load: float = 110.0,
+    tyre_compound: str = 'medium',
+    enable_safety_car: bool = True,
+    deg_factor: float = 1.0,
+    record_telemetry: bool = True
+) -> tuple:
+    """
+    Simulates a single race with realistic physics.
+    
+    Features:
+    - Fuel load effect (heavier car = slower laps)
+    - Non-linear tyre degradation with cliff
+    - Safety Car probability
+    - Engine reliability and degradation
+    
+    Args:
+        base_lap: Baseline lap time on empty track, fresh tyres, no fuel
+        lap_std: Standard deviation for lap time variability
+        laps: Total race laps
+        pit_lap: Planned pit stop lap
+        pit_loss: Time lost during pit stop (seconds)
+        engine_stress: Engine stress multiplier (0.5=conservative, 2.0=push)
+        reliability: Base engine reliability (0.90-1.0)
+        fuel_load: Starting fuel in kg
+        tyre_compound: 'soft', 'medium', or 'hard'
+        enable_safety_car: Whether to simulate SC events
+        deg_factor: Track abrasiveness multiplier
+        record_telemetry: Build the per-lap telemetry DataFrame. Set to
+            False when only the race outcome is needed.
+    
+    Returns:
+        Tuple of (total_time, telemetry_df, dnf_flag, dnf_lap), or
+        (total_time, None, dnf_flag, dnf_lap, sc_lap_count, avg_lap_time)
+        when record_telemetry is False
+    """
+    compound_id = tyre_compound_id(tyre_compound)
+    core = simulate_race_c or _simulate_race_core_aot or _simulate_race_core
+    result = core(
+        base_lap, lap_std, laps, pit_lap, pit_loss,
+        build_engine_wear_table(engine_stress, laps), reliability,
+        build_fuel_table(laps, fuel_load), compound_id, enable_safety_car,
+        build_tyre_table(deg_factor, laps), record_telemetry
+    )
+    (lap_times, powers, rpms, temps, engine_deg_arr,
+     fuel_pen, tyre_pen, sc_flags, dnf, dnf_lap) = result
+    n = dnf_lap - 1 if dnf else laps
+    total_time = float(lap_times[:n].sum())
+    dnf_lap = int(dnf_lap) if dnf else None
+    
+    if not record_telemetry:
+        avg_lap_time = total_time / n if n else np.nan
+        return total_time, None, bool(dnf), dnf_lap, int(sc_flags[:n].sum()), avg_lap_time
+    
+    df = pd.DataFrame({
+        'Lap': np.arange(1, n + 1),
+        'LapTime': lap_times[:n],
+        'Power': powers[:n],
+        'RPM': rpms[:n],
+        'Temp': temps[:n],
+        'EngineDeg': engine_deg_arr[:n],
+        'FuelPenalty': fuel_pen[:n],
+        'TyreDeg': tyre_pen[:n],
+        'SafetyCar': sc_flags[:n]
+    }, copy=False)
+    # Bit-packed SafetyCar flags (bit i = lap i + 1) for cheap checks in the UI.
+    # Stored as bytes: pandas compares attrs with ==, which arrays break
+    df.attrs['sc_bits'] = np.packbits(sc_flags[:n]).tobytes()
+    return total_time, df, bool(dnf), dnf_lap
+
+
+def core_args(sim_params: dict) -> tuple:
+    """
+    Converts simulate_race keyword arguments into the positional argument
+    tuple expected by run_mc_parallel, filling in defaults.
+    """
+    bound = inspect.signature(simulate_race).bind(**sim_params)
+    bound.apply_defaults()
+    args = bound.arguments
+    args['tyre_compound'] = tyre_compound_id(args['tyre_compound'])
+    return tuple(args.values())
+
+
+@njit(parallel=True, cache=True)
+def run_mc_parallel(params: tuple, sims: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Runs `sims` independent races spread across all CPU cores.
+    
+    Numba gives every worker thread its own random stream, so the
+    simulations stay statistically independent.
+    
+    Args:
+        params: Positional race arguments as returned by core_args
+        sims: Number of races to simulate
+    
+    Returns:
+        Tuple of (total_times, dnf_mask); total_times is NaN for DNFs
+    """
+    (base_lap, lap_std, laps, pit_lap, pit_loss, engine_stress,
+     reliability, fuel_load, compound_id, enable_safety_car, deg_factor, _) = params
+    wear_table = build_engine_wear_table(engine_stress, laps)
+    fuel_table = build_fuel_table(laps, fuel_load)
+    tyre_table = build_tyre_table(deg_factor, laps)
+    
+    times = np.empty(sims)
+    dnf = np.zeros(sims, dtype=np.bool_)
+    for i in prange(sims):
+        result = _simulate_race_core(
+            base_lap, lap_std, laps, pit_lap, pit_loss, wear_table,
+            reliability, fuel_table, compound_id, enable_safety_car, tyre_table,
+            False
+        )
+        dnf[i] = result[8]
+        times[i] = np.nan if result[8] else result[0].sum()
+    return times, dnf
+
+
+def _sim_worker(sim_params: dict) -> tuple[float, bool]:
+    """
+    Process-pool task: simulates one race and returns only (total_time, dnf)
+    to keep the pickled result small. Must stay at module scope so it can
+    be pickled by reference.
+    """
+    total_time, _, dnf, *_ = simulate_race(**sim_params, record_telemetry=False)
+    return total_time, dnf
+
+
+def _init_pool_worker() -> None:
+    """
+    Process-pool initializer: reseeds every random stream from fresh OS
+    entropy. Forked workers otherwise inherit the parent's generator states
+    and would all simulate the same races.
+    """
+    seed_simulator(int(np.random.SeedSequence().generate_state(1)[0]))
+
+
+def run_mc_pool(sim_params: dict, sims: int):
+    """
+    Simulates `sims` races across a multiprocessing pool.
+    
+    The fallback to run_mc_parallel when Numba is not installed. Work is
+    handed out in large chunks so pickling cost stays amortized.
+    
+    Yields:
+        (total_time, dnf) per race, in completion order
+    """
+    processes = os.cpu_count() or 1
+    chunksize = max(32, sims // (processes * 8))
+    with multiprocessing.Pool(processes, initializer=_init_pool_worker) as pool:
+        yield from pool.imap_unordered(
+            _sim_worker, itertools.repeat(sim_params, sims), chunksize=chunksize
+        )
 
 
 class StrategyOptimizer:
@@ -148,8 +382,21 @@ class StrategyOptimizer:
     Optimizes pit stop strategy for a specific track and set of conditions.
     """
     @staticmethod
-    def find_optimal_strategy(sim_params, num_sims_per_config=50):
-        results = []
+    def find_optimal_strategy(sim_params, num_sims_per_config=50, mode='golden'):
+        """
+        Finds the compound and pit lap with the lowest expected race time.
+        
+        Args:
+            sim_params: simulate_race keyword arguments for the race
+            num_sims_per_config: Simulations averaged per (compound, pit_lap)
+            mode: 'golden' runs a bounded scalar search over the pit lap for
+                each compound, relying on the expected time being unimodal
+                in pit lap. 'grid' evaluates every 4th lap of the pit window.
+        
+        Returns:
+            Tuple of (results_df, best_row) over all evaluated strategies,
+            or None if every strategy ended in a DNF
+        """
         laps = sim_params['laps']
         compounds = ['soft', 'medium', 'hard']
         
@@ -158,26 +405,54 @@ class StrategyOptimizer:
         min_pit = max(5, int(laps * 0.2))
         max_pit = min(laps - 5, int(laps * 0.8))
         
-        for compound in compounds:
-            for pit_lap in range(min_pit, max_pit + 1, 2):
-                test_params = sim_params.copy()
-                test_params['tyre_compound'] = compound
-                test_params['pit_lap'] = pit_lap
-                test_params['enable_safety_car'] = False # Reduce noise for optimization
-                
-                sim_times = []
-                for _ in range(num_sims_per_config):
-                    t, _, dnf, _ = simulate_race(**test_params)
-                    if not dnf:
-                        sim_times.append(t)
-                
-                if sim_times:
-                    avg_time = np.mean(sim_times)
-                    results.append({
-                        'compound': compound,
-                        'pit_lap': pit_lap,
-                        'expected_time': avg_time
-                    })
+        test_params = sim_params.copy()
+        test_params['enable_safety_car'] = False # Reduce noise for optimization
+        
+        # Expected time per (compound, pit_lap); inf when every sim DNFs
+        expected = {}
+        
+        def evaluate(configs):
+            # One batch: num_sims_per_config consecutive rows per config
+            test_params['tyre_compound'] = np.repeat(
+                [tyre_compound_id(c) for c, _ in configs], num_sims_per_config
+            )
+            test_params['pit_lap'] = np.repeat([p for _, p in configs], num_sims_per_config)
+            total_times, *_ = _mc_vectorized(len(configs) * num_sims_per_config, **test_params)
+            times = total_times.reshape(len(configs), num_sims_per_config)
+            for config, sim_times in zip(configs, times):
+                finished = sim_times[~np.isnan(sim_times)]
+                expected[config] = finished.mean() if finished.size else np.inf
+        
+        def mean_time(compound, pit_lap):
+            config = (compound, int(round(pit_lap)))
+            if config not in expected:
+                evaluate([config])
+            return expected[config]
+        
+        if mode == 'grid':
+            evaluate([
+                (compound, pit_lap)
+                for compound in compounds
+                for pit_lap in range(min_pit, max_pit + 1, 4)
+            ])
+        elif mode == 'golden':
+            for compound in compounds:
+                minimize_scalar(
+                    lambda pit_lap: mean_time(compound, pit_lap),
+                    bounds=(min_pit, max_pit),
+                    method='bounded',
+                    options={'xatol': 1.0}
+                )
+        else:
+            raise ValueError(f"Unknown optimization mode: {mode}")
+        
+        results = [
+            {'compound': compound, 'pit_lap': pit_lap, 'expected_time': avg_time}
+            for (compound, pit_lap), avg_time in sorted(
+                expected.items(), key=lambda item: (compounds.index(item[0][0]), item[0][1])
+            )
+            if np.isfinite(avg_time)
+        ]
         
         if not results:
             return None
@@ -187,35 +462,190 @@ class StrategyOptimizer:
         return df, df.loc[best_idx]
 
 
+# Simulations per block in _mc_vectorized: each (MC_CHUNK,) float64 vector
+# is 16 KB, so one lap's working set stays resident in L2
+MC_CHUNK = 2048
+
+
+def _mc_vectorized(
+    sims: int,
+    base_lap: float = 90.0,
+    lap_std: float = 0.5,
+    laps: int = 50,
+    pit_lap: int = 25,
+    pit_loss: float = 22.0,
+    engine_stress: float = 1.0,
+    reliability: float = 0.98,
+    fuel_load: float = 110.0,
+    tyre_compound: str | np.ndarray = 'medium',
+    enable_safety_car: bool = True,
+    deg_factor: float = 1.0,
+    seed: int | None = None
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Simulates `sims` independent races at once using (sims,)-shaped arrays.
+    
+    Follows the same lap-by-lap physics as simulate_race, but every
+    per-car quantity is a vector, so one Python iteration advances all
+    simulations by a lap. No telemetry is recorded. Simulations are run in
+    blocks of MC_CHUNK to keep the per-lap vectors cache-resident.
+    
+    Each block draws its random numbers up front in two bulk calls from one
+    generator, so a given `seed` reproduces the whole batch exactly. Without
+    a seed the shared module generator (see seed_simulator) is used.
+    
+    Per-lap scratch vectors and lookup tables are float32 to halve memory
+    traffic; race totals are still accumulated in float64.
+    
+    `pit_lap` and `tyre_compound` may also be (sims,) arrays, the latter
+    holding ids from tyre_compound_id, so that one batch can cover many
+    strategies at once.
+    
+    Returns:
+        Tuple of (total_times, dnf_mask, laps_completed, sc_lap_counts);
+        total_times is NaN for DNF simulations.
+    """
+    rng = _rng if seed is None else np.random.default_rng(seed)
+    wear_table = build_engine_wear_table(engine_stress, laps).astype(np.float32)
+    fuel_table = build_fuel_table(laps, fuel_load).astype(np.float32)
+    sc_prob_table = build_safety_car_table(laps) if enable_safety_car else None
+    tyre_table = build_tyre_table(deg_factor, laps).astype(np.float32)
+    if isinstance(tyre_compound, str):
+        tyre_compound = tyre_compound_id(tyre_compound)
+    compound_ids = np.broadcast_to(tyre_compound, sims)
+    pit_laps = np.broadcast_to(pit_lap, sims)
+    
+    total_times = np.empty(sims)
+    dnf_mask = np.empty(sims, dtype=bool)
+    laps_completed = np.empty(sims, dtype=np.int32)
+    sc_lap_counts = np.empty(sims, dtype=np.int32)
+    
+    for start in range(0, sims, MC_CHUNK):
+        block = slice(start, min(start + MC_CHUNK, sims))
+        (total_times[block], dnf_mask[block],
+         laps_completed[block], sc_lap_counts[block]) = _mc_chunk(
+            rng, base_lap, lap_std, laps, pit_laps[block], pit_loss, wear_table,
+            reliability, compound_ids[block], fuel_table, sc_prob_table, tyre_table
+        )
+    return total_times, dnf_mask, laps_completed, sc_lap_counts
+
+
+def _mc_chunk(
+    rng: np.random.Generator,
+    base_lap: float,
+    lap_std: float,
+    laps: int,
+    pit_laps: np.ndarray,
+    pit_loss: float,
+    wear_table: np.ndarray,
+    reliability: float,
+    compound_ids: np.ndarray,
+    fuel_table: np.ndarray,
+    sc_prob_table: np.ndarray | None,
+    tyre_table: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Runs one block of _mc_vectorized; the block size is len(pit_laps).
+    `sc_prob_table` is None when Safety Cars are disabled.
+    """
+    n = len(pit_laps)
+    # Lap-major layout so each lap's draws are contiguous
+    # normals:  0 = RPM, 1 = engine wear, 2 = lap time
+    # uniforms: 0 = failure, 1 = SC trigger, 2 = SC duration, 3 = throttle
+    normals = rng.standard_normal((laps, 3, n), dtype=np.float32)
+    uniforms = rng.random((laps, 4, n), dtype=np.float32)
+    
+    total_times = np.zeros(n)
+    engine_deg = np.zeros(n, dtype=np.float32)
+    stint_lap = np.zeros(n, dtype=int)
+    running = np.ones(n, dtype=bool)
+    dnf_lap = np.zeros(n, dtype=np.int32)
+    
+    # Safety Car state
+    sc_active = np.zeros(n, dtype=bool)
+    sc_remaining = np.zeros(n, dtype=np.int32)
+    sc_lap_counts = np.zeros(n, dtype=np.int32)
+    
+    for lap in range(1, laps + 1):
+        i = lap - 1
+        stint_lap += 1
+        
+        # --- Safety Car Check ---
+        if sc_prob_table is not None:
+            triggers = ~sc_active & (uniforms[i, 1] < sc_prob_table[i])
+            sc_duration = (uniforms[i, 2] * 4 + 3).astype(np.int32)
+            sc_remaining = np.where(triggers, sc_duration, sc_remaining)
+            sc_active |= triggers
+            sc_remaining -= sc_active
+            sc_active &= sc_remaining > 0
+        
+        # --- Engine Telemetry ---
+        rpm = 12000 + 400 * normals[i, 0]
+        throttle = 85 + 15 * uniforms[i, 3]
+        power = engine_power(throttle, rpm, engine_deg)
+        
+        # --- Fuel Effect ---
+        fuel_penalty = fuel_table[i]
+        
+        # --- Tyre Degradation ---
+        tyre_deg_penalty, grip_bonus = tyre_table[compound_ids, stint_lap].T
+        
+        # --- Lap Time Calculation ---
+        lap_time = _assemble_lap_time(
+            sc_active, np.float32(base_lap), fuel_penalty, tyre_deg_penalty,
+            grip_bonus, power, np.float32(lap_std) * normals[i, 2]
+        )
+        
+        # --- DNF Check (Engine Failure) ---
+        failure_prob = (1 - reliability) * (1 + engine_deg * 10)
+        failed = running & (uniforms[i, 0] < failure_prob)
+        dnf_lap[failed] = lap
+        running &= ~failed
+        
+        # --- Pit Stop ---
+        pitting = pit_laps == lap
+        lap_time = np.where(pitting, lap_time + pit_loss, lap_time)
+        stint_lap = np.where(pitting, 0, stint_lap)
+        
+        # --- Update Engine ---
+        engine_deg = np.clip(engine_deg + wear_table[i] + 0.0002 * normals[i, 1], 0.0, 1.0)
+        
+        total_times += np.where(running, lap_time, 0.0)
+        sc_lap_counts += running & sc_active
+    
+    dnf_mask = ~running
+    total_times[dnf_mask] = np.nan
+    laps_completed = np.where(dnf_mask, dnf_lap, laps)
+    return total_times, dnf_mask, laps_completed, sc_lap_counts
+
+
 def run_monte_carlo(
     num_simulations: int = 1000, 
+    seed: int | None = None,
+    as_dataframe: bool = False,
     **sim_params
-) -> pd.DataFrame:
+) -> dict[str, np.ndarray] | pd.DataFrame:
     """
     Runs multiple race simulations for strategy analysis.
     
+    Args:
+        num_simulations: Number of races to simulate
+        seed: Optional RNG seed for reproducible results
+        as_dataframe: Wrap the result columns in a DataFrame
+        **sim_params: Keyword arguments accepted by simulate_race
+    
     Returns:
-        DataFrame with simulation results including:
+        Dict of NumPy arrays (or a DataFrame if as_dataframe) with columns:
         - SimID, LapsCompleted, Finished, TotalTime, AvgLapTime, SafetyCarLaps
     """
-    all_results = []
-    
-    for i in range(num_simulations):
-        total_time, race_df, dnf, dnf_lap = simulate_race(**sim_params)
-        
-        last_lap = race_df['Lap'].max() if not race_df.empty else 0
-        if dnf:
-            last_lap = dnf_lap
-        
-        sc_laps = race_df['SafetyCar'].sum() if not race_df.empty else 0
-        
-        all_results.append({
-            'SimID': i,
-            'LapsCompleted': last_lap,
-            'Finished': not dnf,
-            'TotalTime': total_time if not dnf else np.nan,
-            'AvgLapTime': race_df['LapTime'].mean() if not dnf else np.nan,
-            'SafetyCarLaps': sc_laps
-        })
+    total_times, dnf_mask, laps_completed, sc_laps = _mc_vectorized(num_simulations, seed=seed, **sim_params)
     
-    return pd.DataFrame(all_results)
+    results = {
+        'SimID': np.arange(num_simulations),
+        'LapsCompleted': laps_completed,
+        'Finished': ~dnf_mask,
+        'TotalTime': total_times,
+        'AvgLapTime': total_times / laps_completed,
+        'SafetyCarLaps': sc_laps
+    }
+    return pd.DataFrame(results, copy=False) if as_dataframe else results
@@ -0,0 +1,163 @@
+# cython: language_level=3
+"""
+Copyright (c) 2026 Steve Mathews Korah. All rights reserved.
+
+DISCLAIMER: This project, "Race-Monte-Carlo-Simulation", is proprietary software.
+Any external use, reproduction, or distribution of this code in any capacity
+without explicit written permission from Steve Mathews Korah is strictly prohibited.
+
+This project utilizes the "Fast-F1" library (theOehrly/Fast-F1).
+We do not claim ownership of the Fast-F1 library or the underlying F1 data
+provided by its API. Use of Fast-F1 data is subject to their own terms and disclaimers.
+"""
+import numpy as np
+cimport cython
+from cpython.pycapsule cimport PyCapsule_GetPointer
+from numpy.random cimport bitgen_t
+from numpy.random import PCG64
+from numpy.random.c_distributions cimport (
+    random_standard_normal,
+    random_standard_uniform,
+    random_interval
+)
+from engine_model import build_safety_car_table
+
+_bit_generator = PCG64()
+cdef bitgen_t *_rng = <bitgen_t *> PyCapsule_GetPointer(_bit_generator.capsule, "BitGenerator")
+
+
+def seed_race_c(seed=None):
+    """Reseeds the PCG64 stream used by simulate_race_c."""
+    with _bit_generator.lock:
+        _bit_generator.state = PCG64(seed).state
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+cpdef tuple simulate_race_c(
+    double base_lap,
+    double lap_std,
+    int laps,
+    int pit_lap,
+    double pit_loss,
+    const double[::1] wear_table,
+    double reliability,
+    const double[::1] fuel_table,
+    int compound_id,
+    bint enable_sc,
+    const double[:, :, ::1] tyre_table,
+    bint record
+):
+    """
+    Ahead-of-time compiled equivalent of race_simulator._simulate_race_core.
+
+    Takes the same arguments, including the wear, fuel and tyre tables from
+    engine_model, and returns the same tuple as the Numba core, without any
+    JIT warmup.
+    """
+    cdef Py_ssize_t n_tel = laps if record else 0
+    lap_times_arr = np.empty(laps)
+    powers_arr = np.empty(n_tel)
+    rpms_arr = np.empty(n_tel)
+    temps_arr = np.empty(n_tel)
+    engine_deg_out = np.empty(n_tel)
+    fuel_pen_arr = np.empty(n_tel)
+    tyre_pen_arr = np.empty(n_tel)
+    sc_flags_arr = np.zeros(laps, dtype=np.uint8)
+
+    cdef double[::1] lap_times = lap_times_arr
+    cdef double[::1] powers = powers_arr
+    cdef double[::1] rpms = rpms_arr
+    cdef double[::1] temps = temps_arr
+    cdef double[::1] engine_deg_arr = engine_deg_out
+    cdef double[::1] fuel_pen = fuel_pen_arr
+    cdef double[::1] tyre_pen = tyre_pen_arr
+    cdef unsigned char[::1] sc_flags = sc_flags_arr
+
+    cdef const double[::1] sc_prob = build_safety_car_table(laps)
+
+    cdef double engine_deg = 0.0
+    cdef long stint_lap = 0
+    cdef bint dnf = False
+    cdef long dnf_lap = 0
+    cdef bint sc_active = False
+    cdef long sc_laps_remaining = 0
+
+    cdef long lap
+    cdef Py_ssize_t i
+    cdef double rpm, throttle, temp, power, fuel_penalty, tyre_deg_penalty, grip_bonus, lap_time
+
+    with _bit_generator.lock, nogil:
+        for lap in range(1, laps + 1):
+            stint_lap += 1
+
+            # --- Safety Car Check ---
+            if enable_sc and not sc_active:
+                if random_standard_uniform(_rng) < sc_prob[lap - 1]:
+                    sc_active = True
+                    sc_laps_remaining = 3 + <long>random_interval(_rng, 3)
+
+            if sc_active:
+                sc_laps_remaining -= 1
+                if sc_laps_remaining <= 0:
+                    sc_active = False
+
+            # --- Engine Telemetry ---
+            rpm = 12000 + 400 * random_standard_normal(_rng)
+            throttle = 85 + 15 * random_standard_uniform(_rng)
+            temp = 90 + engine_deg * 220 + 1.5 * random_standard_normal(_rng)
+            power = 1000 * (throttle / 100) * (rpm / 15000) * (1 - engine_deg)
+
+            # --- Fuel Effect ---
+            fuel_penalty = fuel_table[lap - 1]
+
+            # --- Tyre Degradation ---
+            tyre_deg_penalty = tyre_table[compound_id, stint_lap, 0]
+            grip_bonus = tyre_table[compound_id, stint_lap, 1]
+
+            # --- Lap Time Calculation ---
+            if sc_active:
+                lap_time = base_lap + 30.0
+            else:
+                lap_time = (
+                    base_lap
+                    + fuel_penalty
+                    + tyre_deg_penalty
+                    + grip_bonus
+                    - (power - 900) * 0.002
+                    + lap_std * random_standard_normal(_rng)
+                )
+
+            # --- DNF Check (Engine Failure) ---
+            if random_standard_uniform(_rng) < (1 - reliability) * (1 + engine_deg * 10):
+                dnf = True
+                dnf_lap = lap
+                break
+
+            # --- Pit Stop ---
+            if lap == pit_lap:
+                lap_time += pit_loss
+                stint_lap = 0
+
+            # --- Update Engine ---
+            engine_deg = min(1.0, max(0.0,
+                engine_deg
+                + wear_table[lap - 1]
+                + 0.0002 * random_standard_normal(_rng)
+            ))
+
+            # --- Log Telemetry ---
+            i = lap - 1
+            lap_times[i] = lap_time
+            sc_flags[i] = sc_active
+            if record:
+                powers[i] = power
+                rpms[i] = rpm
+                temps[i] = temp
+                engine_deg_arr[i] = engine_deg
+                fuel_pen[i] = fuel_penalty
+                tyre_pen[i] = tyre_deg_penalty
+
+    return (lap_times_arr, powers_arr, rpms_arr, temps_arr, engine_deg_out,
+            fuel_pen_arr, tyre_pen_arr, sc_flags_arr.view(np.bool_), dnf, dnf_lap)
@@ -0,0 +1,34 @@
+"""
+Builds the optional Cython race kernel (race_simulator_c) in place:
+
+    python setup.py build_ext --inplace
+
+race_simulator falls back to the Numba kernel when the extension is absent.
+"""
+import os
+
+import numpy as np
+from Cython.Build import cythonize
+from setuptools import Extension, setup
+
+NUMPY_DIR = os.path.dirname(np.__file__)
+
+extensions = [
+    Extension(
+        'race_simulator_c',
+        ['race_simulator_c.pyx'],
+        include_dirs=[np.get_include()],
+        library_dirs=[
+            os.path.join(NUMPY_DIR, 'random', 'lib'),
+            os.path.join(NUMPY_DIR, '_core', 'lib'),
+            os.path.join(NUMPY_DIR, 'core', 'lib'),
+        ],
+        libraries=['npyrandom', 'npymath'],
+        define_macros=[('NPY_NO_DEPRECATED_API', 'NPY_1_7_API_VERSION')],
+    )
+]
+
+setup(
+    name='race-monte-carlo-simulation',
+    ext_modules=cythonize(extensions),
+)
@@ -0,0 +1,22 @@
+import multiprocessing
+import os
+import time
+
+import numpy as np
+
+from race_simulator import _init_pool_worker, simulate_race
+
+
+def _first_race(_):
+    # Hold the worker so each one takes exactly one task
+    time.sleep(0.2)
+    total_time, *_ = simulate_race(reliability=1.0, record_telemetry=False)
+    return os.getpid(), total_time
+
+
+def test_pool_workers_draw_different_races():
+    # Fork is where workers inherit the parent's generator state
+    with multiprocessing.get_context('fork').Pool(2, initializer=_init_pool_worker) as pool:
+        (pid_a, time_a), (pid_b, time_b) = pool.map(_first_race, range(2), chunksize=1)
+    assert pid_a != pid_b
+    assert time_a != time_b
@@ -9,147 +9,280 @@ This project utilizes the "Fast-F1" library (theOehrly/Fast-F1).
 We do not claim ownership of the Fast-F1 library or the underlying F1 data 
 provided by its API. Use of Fast-F1 data is subject to their own terms and disclaimers.
 """
-import fastf1
 import streamlit as st
 import plotly.graph_objects as go
+from plotly.subplots import make_subplots
 import numpy as np
+from numba_compat import njit
 
+try:
+    from tsdownsample import MinMaxLTTBDownsampler
+except ImportError:
+    MinMaxLTTBDownsampler = None
 
-def show_telemetry(df):
+# Traces longer than this are downsampled before plotting
+MAX_TRACE_POINTS = 2000
+
+# Figures kept per cached builder; every new race or optimizer run adds one
+FIGURE_CACHE_ENTRIES = 8
+
+# Laps averaged by the rolling lap time overlay
+ROLLING_WINDOW = 5
+
+# Layout shared by every figure, plus the horizontal legend above the plot
+_BASE_LAYOUT = dict(template='plotly_dark')
+_TOP_LEGEND = dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
+
+# Strategy plot styling per tyre compound
+_COMPOUND_COLORS = {'soft': '#ff4b4b', 'medium': '#f1c40f', 'hard': '#ecf0f1'}
+_COMPOUND_LABELS = {'soft': 'Soft Strategy', 'medium': 'Medium Strategy', 'hard': 'Hard Strategy'}
+
+# Figure and panel titles
+_TITLES = {
+    'lap': '⏱️ Lap Time Evolution',
+    'pwr': '⚡ Engine Power',
+    'temp': '🌡️ Engine Temperature',
+    'fuel': '⛽ Fuel Weight Penalty',
+    'tyre': '🛞 Tyre Degradation Effect',
+    'comparison': 'Simulated vs Real Lap Times',
+    'strategy': 'Strategy Optimization Analysis',
+}
+
+# Telemetry panels as (column, title, y-axis title, color); lap time spans the top row
+_TELEMETRY_PANELS = (
+    ('LapTime', _TITLES['lap'], 'Lap Time (s)', '#3498db'),
+    ('Power', _TITLES['pwr'], 'Power (hp)', '#e74c3c'),
+    ('Temp', _TITLES['temp'], 'Temperature (°C)', '#f39c12'),
+)
+_FUEL_TYRE_PANELS = (
+    ('FuelPenalty', _TITLES['fuel'], 'Time Penalty (s)', '#9b59b6'),
+    ('TyreDeg', _TITLES['tyre'], 'Time Penalty (s)', '#2ecc71'),
+)
+
+
+def _downsampled_xy(x, y, n_out=MAX_TRACE_POINTS):
     """
-    Displays race telemetry using Plotly for professional axis labeling and units.
+    Reduces a trace (NumPy arrays) to about n_out points with MinMaxLTTB,
+    keeping its visual shape, and returns it as x/y keyword arguments for a
+    trace. Short traces (a normal race) are passed through unchanged, as are
+    all traces when tsdownsample is not installed.
+    
+    Callers pass float32/int32 arrays, which Plotly (>= 6) sends to the
+    browser as compact base64 typed arrays instead of JSON number lists.
     """
-    # Lap Time Evolution
-    fig_lap = go.Figure()
-    fig_lap.add_trace(go.Scatter(x=df['Lap'], y=df['LapTime'], name='Lap Time', line=dict(color='#3498db', width=2)))
-    fig_lap.update_layout(
-        title='⏱️ Lap Time Evolution',
-        xaxis_title='Lap Number',
-        yaxis_title='Lap Time (s)',
-        template='plotly_dark',
-        height=350,
-        margin=dict(l=20, r=20, t=50, b=20)
-    )
-    st.plotly_chart(fig_lap, use_container_width=True)
+    if len(y) > n_out and MinMaxLTTBDownsampler is not None:
+        idx = MinMaxLTTBDownsampler().downsample(x, y, n_out=n_out)
+        x, y = x[idx], y[idx]
+    return dict(x=x, y=y)
+
+
+@njit(cache=True, fastmath=True)
+def _lap_stats(lap_time, window):
+    """
+    Computes the trailing rolling mean of lap time over `window` laps
+    (averaging fewer laps at the start of the race) and the index of the
+    fastest lap, in one pass.
+    """
+    n = len(lap_time)
+    rolling = np.empty(n)
+    total = 0.0
+    fastest = 0
+    for i in range(n):
+        total += lap_time[i]
+        if i >= window:
+            total -= lap_time[i - window]
+        rolling[i] = total / min(i + 1, window)
+        if lap_time[i] < lap_time[fastest]:
+            fastest = i
+    return rolling, fastest
 
-    col1, col2 = st.columns(2)
+
+def _mk_fig(title, x_title, y_title, **layout):
+    """
+    Creates an empty figure with the shared layout, title and axis titles.
+    """
+    fig = go.Figure()
+    fig.update_layout(_BASE_LAYOUT, title=title, xaxis_title=x_title, yaxis_title=y_title, **layout)
+    return fig
+
+
+@st.cache_resource(show_spinner=False, max_entries=FIGURE_CACHE_ENTRIES)
+def _build_telemetry_figure(df):
+    """
+    Builds all telemetry panels for a race as one subplotted figure.
+    Cached on the DataFrame contents, so reruns with the same race reuse
+    the built figure instead of assembling and validating it again.
+    """
+    laps = df['Lap'].to_numpy(dtype=np.int32)
+    panels = _TELEMETRY_PANELS
+    # Fuel and Tyre Effects
+    if 'FuelPenalty' in df.columns:
+        panels += _FUEL_TYRE_PANELS
+    rows = 1 + (len(panels) - 1) // 2
+    positions = [(1, 1)] + [(2 + i // 2, 1 + i % 2) for i in range(len(panels) - 1)]
     
-    # Engine Power
-    with col1:
-        fig_pwr = go.Figure()
-        fig_pwr.add_trace(go.Scatter(x=df['Lap'], y=df['Power'], name='Power', line=dict(color='#e74c3c', width=2)))
-        fig_pwr.update_layout(
-            title='⚡ Engine Power',
-            xaxis_title='Lap Number',
-            yaxis_title='Power (hp)',
-            template='plotly_dark',
-            height=300,
-            margin=dict(l=20, r=20, t=50, b=20)
+    fig = make_subplots(
+        rows=rows, cols=2,
+        specs=[[{'colspan': 2}, None]] + [[{}, {}]] * (rows - 1),
+        subplot_titles=[title for _, title, _, _ in panels],
+        vertical_spacing=0.08
+    )
+    for (col, title, y_title, color), (r, c) in zip(panels, positions):
+        fig.add_trace(
+            go.Scattergl(**_downsampled_xy(laps, df[col].to_numpy(dtype=np.float32)), name=title, line=dict(color=color, width=2)),
+            row=r, col=c
         )
-        st.plotly_chart(fig_pwr, use_container_width=True)
+        fig.update_xaxes(title_text='Lap Number', row=r, col=c)
+        fig.update_yaxes(title_text=y_title, row=r, col=c)
     
-    # Engine Temperature
-    with col2:
-        fig_temp = go.Figure()
-        fig_temp.add_trace(go.Scatter(x=df['Lap'], y=df['Temp'], name='Temp', line=dict(color='#f39c12', width=2)))
-        fig_temp.update_layout(
-            title='🌡️ Engine Temperature',
-            xaxis_title='Lap Number',
-            yaxis_title='Temperature (°C)',
-            template='plotly_dark',
-            height=300,
-            margin=dict(l=20, r=20, t=50, b=20)
+    # Rolling mean and fastest lap on the lap time panel
+    lap_time = df['LapTime'].to_numpy()
+    if len(lap_time):
+        rolling, fastest = _lap_stats(lap_time, ROLLING_WINDOW)
+        fig.add_trace(
+            go.Scattergl(**_downsampled_xy(laps, rolling.astype(np.float32)), name=f'{ROLLING_WINDOW}-Lap Average', line=dict(color='#ecf0f1', width=1, dash='dash')),
+            row=1, col=1
+        )
+        fig.add_annotation(
+            x=int(laps[fastest]), y=float(lap_time[fastest]), text=f'Fastest: {lap_time[fastest]:.3f}s',
+            showarrow=True, arrowhead=2, row=1, col=1
         )
-        st.plotly_chart(fig_temp, use_container_width=True)
     
-    # Fuel and Tyre Effects
-    if 'FuelPenalty' in df.columns:
-        col3, col4 = st.columns(2)
-        
-        with col3:
-            fig_fuel = go.Figure()
-            fig_fuel.add_trace(go.Scatter(x=df['Lap'], y=df['FuelPenalty'], name='Fuel Penalty', line=dict(color='#9b59b6', width=2)))
-            fig_fuel.update_layout(
-                title='⛽ Fuel Weight Penalty',
-                xaxis_title='Lap Number',
-                yaxis_title='Time Penalty (s)',
-                template='plotly_dark',
-                height=300,
-                margin=dict(l=20, r=20, t=50, b=20)
-            )
-            st.plotly_chart(fig_fuel, use_container_width=True)
-        
-        with col4:
-            fig_tyre = go.Figure()
-            fig_tyre.add_trace(go.Scatter(x=df['Lap'], y=df['TyreDeg'], name='Tyre Deg', line=dict(color='#2ecc71', width=2)))
-            fig_tyre.update_layout(
-                title='🛞 Tyre Degradation Effect',
-                xaxis_title='Lap Number',
-                yaxis_title='Time Penalty (s)',
-                template='plotly_dark',
-                height=300,
-                margin=dict(l=20, r=20, t=50, b=20)
-            )
-            st.plotly_chart(fig_tyre, use_container_width=True)
+    fig.update_layout(
+        _BASE_LAYOUT,
+        height=350 + 300 * (rows - 1),
+        showlegend=False,
+        margin=dict(l=20, r=20, t=50, b=20)
+    )
+    return fig
+
+@st.fragment
+def show_telemetry(df):
+    """
+    Displays race telemetry using Plotly for professional axis labeling and units.
+    Runs as a fragment, so interacting with the chart only reruns this block.
+    """
+    st.plotly_chart(_build_telemetry_figure(df), use_container_width=True)
     
     # Safety Car indicator
-    if 'SafetyCar' in df.columns and df['SafetyCar'].any():
-        sc_laps = df[df['SafetyCar'] == True]['Lap'].tolist()
-        st.info(f"🚗 Safety Car active on laps: {sc_laps}")
+    if 'sc_bits' in df.attrs:
+        # Bit-packed flags from simulate_race; bit i is lap i + 1
+        sc_bits = df.attrs['sc_bits']
+        if any(sc_bits):
+            sc_laps = (np.flatnonzero(np.unpackbits(np.frombuffer(sc_bits, dtype=np.uint8))) + 1).tolist()
+            st.info(f"🚗 Safety Car active on laps: {sc_laps}")
+    elif 'SafetyCar' in df.columns:
+        sc_mask = df['SafetyCar'].to_numpy(dtype=bool)
+        if sc_mask.any():
+            sc_laps = df['Lap'].to_numpy()[sc_mask].tolist()
+            st.info(f"🚗 Safety Car active on laps: {sc_laps}")
+
+@st.fragment
+def show_comparison(sim_df, real_df, driver_code):
+    """
+    Displays the simulated vs real lap time plot.
+    Runs as a fragment, so interacting with the chart only reruns this block.
+    """
+    st.plotly_chart(plot_comparison(sim_df, real_df, driver_code), use_container_width=True)
 
 def plot_comparison(sim_df, real_df, driver_code):
     """
     Plots a comparison between simulated lap times and real-world F1 data.
+    The returned figure is cached and shared; do not modify it.
     """
-    fig = go.Figure()
+    # Only the four plotted columns are hashed for the cache key, not both frames
+    return _build_comparison(
+        sim_df['Lap'].to_numpy(dtype=np.int32), sim_df['LapTime'].to_numpy(dtype=np.float32),
+        real_df['LapNumber'].to_numpy(dtype=np.float32), real_df['LapTimeSeconds'].to_numpy(dtype=np.float32),
+        driver_code
+    )
+
+@st.cache_resource(show_spinner=False, max_entries=FIGURE_CACHE_ENTRIES)
+def _build_comparison(sim_lap, sim_time, real_lap, real_time, driver_code):
+    """
+    Builds the comparison figure from the plotted arrays.
+    """
+    fig = _mk_fig(_TITLES['comparison'], 'Lap Number', 'Lap Time (s)', legend=_TOP_LEGEND)
     
     # Simulated Lap Times
-    fig.add_trace(go.Scatter(
-        x=sim_df['Lap'], 
-        y=sim_df['LapTime'],
+    fig.add_trace(go.Scattergl(
+        **_downsampled_xy(sim_lap, sim_time),
         name='Simulated Lap Time',
         line=dict(color='#3498db', width=2)
     ))
     
     # Real Lap Times
-    fig.add_trace(go.Scatter(
-        x=real_df['LapNumber'], 
-        y=real_df['LapTimeSeconds'],
+    fig.add_trace(go.Scattergl(
+        **_downsampled_xy(real_lap, real_time),
         name=f'Real Lap Time ({driver_code})',
         line=dict(color='#e74c3c', width=2, dash='dot')
     ))
-    
-    fig.update_layout(
-        title='Simulated vs Real Lap Times',
-        xaxis_title='Lap Number',
-        yaxis_title='Lap Time (s)',
-        template='plotly_dark',
-        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
-    )
     return fig
-def plot_strategy_optimization(results_df):
+
+@st.cache_resource(show_spinner=False, max_entries=FIGURE_CACHE_ENTRIES)
+def plot_strategy_optimization(results_df, mode='heatmap'):
     """
-    Plots a heatmap-style line chart for strategy optimization results.
+    Plots strategy optimization results.
+    
+    mode='heatmap' draws expected race time as one compound x pit lap
+    heatmap; mode='lines' draws one line per compound instead. The heatmap
+    expects a full pit lap grid (StrategyOptimizer mode='grid'); sparse
+    results are drawn as lines, since Plotly would stretch the cells
+    around the gaps.
+    The returned figure is cached and shared; do not modify it.
     """
-    fig = go.Figure()
+    if mode == 'heatmap':
+        grid = results_df.pivot(index='compound', columns='pit_lap', values='expected_time')
+        if grid.isna().to_numpy().mean() > 0.25:
+            return plot_strategy_optimization(results_df, 'lines')
+        # Known compounds first, softest at the top
+        known = [c for c in _COMPOUND_COLORS if c in grid.index]
+        grid = grid.reindex(known + [c for c in grid.index if c not in _COMPOUND_COLORS])
+        
+        fig = _mk_fig(_TITLES['strategy'], 'Pit Stop Lap', 'Compound')
+        fig.add_trace(go.Heatmap(
+            z=grid.to_numpy(dtype=np.float32),
+            x=grid.columns.to_numpy(dtype=np.int32),
+            y=[c.capitalize() for c in grid.index],
+            colorscale='RdYlGn_r',
+            colorbar=dict(title='Expected Race Time (s)'),
+            hoverongaps=False
+        ))
+        fig.update_yaxes(autorange='reversed')
+        return fig
+    elif mode != 'lines':
+        raise ValueError(f"Unknown plot mode: {mode}")
     
-    compounds = results_df['compound'].unique()
-    colors = {'soft': '#ff4b4b', 'medium': '#f1c40f', 'hard': '#ecf0f1'}
+    fig = _mk_fig(_TITLES['strategy'], 'Pit Stop Lap', 'Expected Race Time (s)', legend=_TOP_LEGEND)
     
-    for compound in compounds:
-        df = results_df[results_df['compound'] == compound]
-        fig.add_trace(go.Scatter(
-            x=df['pit_lap'], 
-            y=df['expected_time'],
-            name=f'{compound.capitalize()} Strategy',
-            line=dict(color=colors.get(compound, '#95a5a6'), width=3)
-        ))
+    # Sort once by compound, then slice each compound's rows out of plain arrays
+    results_sorted = results_df.sort_values('compound', kind='stable')
+    compounds, starts = np.unique(results_sorted['compound'].to_numpy(), return_index=True)
+    ends = np.r_[starts[1:], len(results_sorted)]
+    slices = {c: slice(start, end) for c, start, end in zip(compounds, starts, ends)}
+    # Known compounds first, softest first, matching the optimizer's order
+    order = [c for c in _COMPOUND_COLORS if c in slices] + [c for c in slices if c not in _COMPOUND_COLORS]
+    pit_lap = results_sorted['pit_lap'].to_numpy(dtype=np.int32)
+    expected = results_sorted['expected_time'].to_numpy(dtype=np.float32)
     
-    fig.update_layout(
-        title='Strategy Optimization Analysis',
-        xaxis_title='Pit Stop Lap',
-        yaxis_title='Expected Race Time (s)',
-        template='plotly_dark',
-        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
-    )
+    fig.add_traces([
+        go.Scattergl(
+            x=pit_lap[slices[compound]], 
+            y=expected[slices[compound]],
+            name=_COMPOUND_LABELS.get(compound, f'{compound.capitalize()} Strategy'),
+            line=dict(color=_COMPOUND_COLORS.get(compound, '#95a5a6'), width=3)
+        )
+        for compound in order
+    ])
     return fig
+
+@st.fragment
+def show_strategy_optimization(results_df, mode=None):
+    """
+    Displays the strategy optimization plot, with a heatmap/lines toggle
+    unless `mode` is given. Runs as a fragment, so switching views only
+    reruns this block.
+    """
+    if mode is None:
+        mode = st.radio("Strategy view", ['heatmap', 'lines'], horizontal=True, format_func=str.capitalize)
+    st.plotly_chart(plot_strategy_optimization(results_df, mode), use_container_width=True)